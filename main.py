@@ -5,13 +5,47 @@ A PySide6-based GUI application for sorting and organizing files.
 
 import sys
 import os
-import shutil
-import hashlib
 import logging
+import functools
+import sqlite3
+import threading
+from collections import defaultdict
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
 from PySide6.QtWidgets import (
     QApplication, QMainWindow, QWidget, QVBoxLayout,
-    QPushButton, QTextEdit, QLabel, QFileDialog, QCheckBox
+    QPushButton, QTextEdit, QLabel, QFileDialog, QCheckBox,
+    QProgressBar
 )
+from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal
+
+# Optional: BLAKE3 hashes several times faster than anything in hashlib.
+try:
+    from blake3 import blake3
+except ImportError:
+    blake3 = None
+
+# Optional: XXH3 is a non-cryptographic fallback still well past SHA-256.
+try:
+    import xxhash
+except ImportError:
+    xxhash = None
+
+# Optional: RapidFuzz scores all filename pairs in C instead of Python.
+try:
+    import numpy as np
+except ImportError:
+    np = None
+try:
+    from rapidfuzz import fuzz, process
+except ImportError:
+    fuzz = process = None
+
+# Optional: Numba JIT-compiles the pairwise scorer when RapidFuzz is missing.
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = prange = None
 
 # Configure logging
 logging.basicConfig(
@@ -72,23 +106,145 @@ DUPLICATES_FOLDER = "Duplicates"
 DUPLICATE_PREFIX = "Dupe"
 EMPTY_FOLDERS_FOLDER = "Empty Folders"
 
+# ============================================================================
+# File Metadata
+# ============================================================================
+@dataclass
+class FileTable:
+    """
+    Column-oriented file metadata: entry i of every list describes the
+    same file. Keeping parallel lists instead of a dict per file avoids
+    per-element dict allocation and key lookups in the analysis passes.
+    """
+    paths: list = field(default_factory=list)
+    names: list = field(default_factory=list)
+    exts: list = field(default_factory=list)
+    sizes: list = field(default_factory=list)
+    mtimes: list = field(default_factory=list)
+    hashes: list = field(default_factory=list)
+
+    def __post_init__(self):
+        n = len(self.paths)
+        if not self.sizes and n:
+            self.sizes = [0] * n
+        if not self.mtimes and n:
+            self.mtimes = [0] * n
+        if not self.hashes and n:
+            self.hashes = [None] * n
+
+    def __len__(self):
+        return len(self.paths)
+
+    @functools.cached_property
+    def stems(self):
+        """
+        Lowercased name stems, computed once on first access. Read only
+        after the table is fully built; add() does not refresh it.
+        """
+        return [name.rsplit('.', 1)[0].lower() for name in self.names]
+
+    def add(self, path, name, ext, size, mtime_ns):
+        self.paths.append(path)
+        self.names.append(name)
+        self.exts.append(ext)
+        self.sizes.append(size)
+        self.mtimes.append(mtime_ns)
+        self.hashes.append(None)
+
+    def drop(self, indices):
+        """Return a new table without the rows at the given indices."""
+        dropped = set(indices)
+        keep = [i for i in range(len(self.paths)) if i not in dropped]
+        return FileTable(
+            paths=[self.paths[i] for i in keep],
+            names=[self.names[i] for i in keep],
+            exts=[self.exts[i] for i in keep],
+            sizes=[self.sizes[i] for i in keep],
+            mtimes=[self.mtimes[i] for i in keep],
+            hashes=[self.hashes[i] for i in keep],
+        )
+
+@dataclass
+class Suggestion:
+    """
+    Proposed folder groups plus the aggregates the results view shows,
+    computed once at construction instead of re-looped on every refresh.
+    """
+    groups: dict = field(default_factory=dict)
+    total: int = 0
+    largest: int = 0
+
+    @classmethod
+    def from_groups(cls, groups):
+        sizes = [len(paths) for paths in groups.values()]
+        return cls(
+            groups=groups,
+            total=sum(sizes),
+            largest=max(sizes, default=0),
+        )
+
+    def __len__(self):
+        return len(self.groups)
+
+    def __bool__(self):
+        return bool(self.groups)
+
 # ============================================================================
 # File Handling Functions
 # ============================================================================
-def safe_move_file(src, dest_folder, prefix=""):
+def _existing_names(folder):
+    """Names already present in folder (empty set if it can't be read)."""
+    try:
+        with os.scandir(folder) as it:
+            return {entry.name for entry in it}
+    except OSError:
+        return set()
+
+def _plan_dest(src, dest_folder, taken, prefix=""):
+    """
+    Pick a collision-free destination purely in memory: `taken` holds
+    every name already present in dest_folder (from one scandir) plus
+    the names planned so far, so no per-file exists() probing.
+    """
     base_name = os.path.basename(src)
-    dest = os.path.join(dest_folder, f"{prefix}{base_name}")
-    counter = 1
-    while os.path.exists(dest):
+    candidate = f"{prefix}{base_name}"
+    if candidate in taken:
         name, ext = os.path.splitext(base_name)
-        dest = os.path.join(dest_folder, f"{prefix}{name}_{counter}{ext}")
-        counter += 1
+        counter = 1
+        candidate = f"{prefix}{name}_{counter}{ext}"
+        while candidate in taken:
+            counter += 1
+            candidate = f"{prefix}{name}_{counter}{ext}"
+    taken.add(candidate)
+    return os.path.join(dest_folder, candidate)
+
+def _move_planned(src, dest, same_dev=False):
+    import shutil
     try:
-        shutil.move(src, dest)
+        # Same filesystem: one rename syscall, no shutil copy fallback.
+        # The planned destination is collision-free, so the clobbering
+        # semantics of os.replace are safe here. same_dev is sampled
+        # from the batch's first source, so a tree crossing a mount
+        # point can still hit EXDEV -- fall back to the copying move
+        # for that file instead of dropping it.
+        if same_dev:
+            try:
+                os.replace(src, dest)
+            except OSError:
+                shutil.move(src, dest)
+        else:
+            shutil.move(src, dest)
     except Exception as e:
         logging.error(f"Error moving {src} to {dest}: {e}")
 
+def _same_device(path_a, path_b):
+    try:
+        return os.stat(path_a).st_dev == os.stat(path_b).st_dev
+    except OSError:
+        return False
+
 def safe_move_folder(src, dest_folder):
+    import shutil
     dest = os.path.join(dest_folder, os.path.basename(src))
     try:
         shutil.move(src, dest)
@@ -96,6 +252,7 @@ def safe_move_folder(src, dest_folder):
         logging.error(f"Error moving folder {src}: {e}")
 
 def safe_delete_folder(path):
+    import shutil
     try:
         shutil.rmtree(path)
     except Exception as e:
@@ -119,135 +276,570 @@ def select_folder(parent):
         return current_dir
     return None
 
+def _list_dir(path):
+    """List one directory: (file entries, subdirectory paths)."""
+    entries, subdirs = [], []
+    try:
+        with os.scandir(path) as it:
+            for entry in it:
+                if entry.is_file(follow_symlinks=False):
+                    entries.append(entry)
+                elif entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+    except OSError as e:
+        logging.error(f"Error scanning {path}: {e}")
+    return entries, subdirs
+
+def _scan_entries(path, recursive):
+    """
+    Yield DirEntry objects for every file under path. Recursive scans
+    fan directory listings out over a small thread pool, submitting
+    subdirectories as they are discovered, so per-directory readdir
+    latency overlaps on cold caches and network filesystems. Yielding
+    the entries themselves lets callers reuse the name and stat data
+    scandir already fetched. A directory's own files always come out
+    before its subdirectories' files.
+    """
+    if not recursive:
+        try:
+            with os.scandir(path) as it:
+                for entry in it:
+                    if entry.is_file(follow_symlinks=False):
+                        yield entry
+        except OSError as e:
+            logging.error(f"Error scanning {path}: {e}")
+        return
+
+    with ThreadPoolExecutor(max_workers=16) as ex:
+        pending = {ex.submit(_list_dir, path)}
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                entries, subdirs = future.result()
+                for sub in subdirs:
+                    pending.add(ex.submit(_list_dir, sub))
+                yield from entries
+
 def get_file_info(folder_path, recursive=False):
-    files = []
-    seen_names = {}
-    duplicates = []
-
-    def scan_dir(path, top_level_only=True):
-        with os.scandir(path) as entries:
-            for entry in entries:
-                if entry.is_file():
-                    yield entry.path
-                elif not top_level_only and entry.is_dir():
-                    yield from scan_dir(entry.path, top_level_only)
-
-    for file_path in scan_dir(folder_path, top_level_only=not recursive):
-        name = os.path.basename(file_path)
-        ext = os.path.splitext(name)[1].lower() or ".no_extension"
-        words = name.rsplit('.', 1)[0].split()
-
-        if name in seen_names:
-            duplicates.append(file_path)
-        else:
-            seen_names[name] = file_path
-            files.append({
-                "path": file_path,
-                "name": name,
-                "ext": ext,
-                "words": words
-            })
-
-    return files, duplicates
-
-def hash_file(file_path):
-    hasher = hashlib.md5()
+    table = FileTable()
+    add = table.add
+
+    for entry in _scan_entries(folder_path, recursive):
+        name = entry.name
+        dot = name.rfind('.')
+        ext = name[dot:].lower() if dot > 0 else ".no_extension"
+
+        try:
+            st = entry.stat(follow_symlinks=False)
+        except OSError as e:
+            logging.error(f"Error reading {entry.path}: {e}")
+            continue
+        add(entry.path, name, ext, st.st_size, st.st_mtime_ns)
+
+    dup_indices = _find_duplicates(table)
+    duplicates = [table.paths[i] for i in sorted(dup_indices)]
+    if dup_indices:
+        table = table.drop(dup_indices)
+    return table, duplicates
+
+def _partial_hash(path):
+    import hashlib
+    with open(path, "rb") as f:
+        return hashlib.blake2b(f.read(65536), digest_size=16).hexdigest()
+
+def _find_duplicates(table):
+    """
+    Find rows with identical contents via a (size, partial-hash,
+    full-hash) cascade, so only files that collide at each stage pay
+    for the next, more expensive check. Returns duplicate row indices;
+    full digests land in table.hashes for downstream reuse.
+    """
+    by_size = {}
+    for i, size in enumerate(table.sizes):
+        by_size.setdefault(size, []).append(i)
+
+    contenders = []
+    for size, group in by_size.items():
+        if size == 0 or len(group) < 2:
+            continue
+        by_partial = {}
+        for i in group:
+            try:
+                by_partial.setdefault(
+                    _partial_hash(table.paths[i]), []
+                ).append(i)
+            except OSError as e:
+                logging.error(f"Error reading {table.paths[i]}: {e}")
+        contenders.extend(
+            c for c in by_partial.values() if len(c) > 1
+        )
+
+    # Full hashing is the expensive stage, so run it for all surviving
+    # candidates at once through the thread pool.
+    digests = _hash_many(
+        (table.paths[i], table.mtimes[i], table.sizes[i])
+        for group in contenders for i in group
+    )
+    dup_indices = []
+    for candidates in contenders:
+        by_full = {}
+        for i in candidates:
+            digest = digests.get(table.paths[i])
+            if digest is None:
+                continue
+            table.hashes[i] = digest
+            by_full.setdefault(digest, []).append(i)
+        for twins in by_full.values():
+            dup_indices.extend(twins[1:])
+    return dup_indices
+
+def _hash_uncached(file_path):
+    import hashlib
+    if blake3 is not None:
+        hasher = blake3(max_threads=blake3.AUTO)
+        hasher.update_mmap(file_path)
+        return hasher.hexdigest()
+    # Digests only gate duplicate detection, so a fast non-cryptographic
+    # hash is acceptable when BLAKE3 is missing.
+    factory = xxhash.xxh3_128 if xxhash is not None else hashlib.sha256
     with open(file_path, "rb") as f:
-        for chunk in iter(lambda: f.read(4096), b""):
-            hasher.update(chunk)
-    return hasher.hexdigest()
+        # Single sequential pass: ask the kernel to read ahead
+        # aggressively, then drop the pages afterwards so hashing a big
+        # tree doesn't evict the rest of the page cache.
+        _fadvise(f.fileno(), getattr(os, "POSIX_FADV_SEQUENTIAL", 0))
+        try:
+            if hasattr(hashlib, "file_digest"):  # Python 3.11+
+                return hashlib.file_digest(f, factory).hexdigest()
+            # Pre-3.11 last resort: reuse one buffer via readinto
+            # instead of allocating a fresh bytes object per chunk.
+            hasher = factory()
+            buf = bytearray(1 << 20)
+            view = memoryview(buf)
+            while (n := f.readinto(buf)):
+                hasher.update(view[:n])
+            return hasher.hexdigest()
+        finally:
+            _fadvise(f.fileno(), getattr(os, "POSIX_FADV_DONTNEED", 0))
+
+def _fadvise(fd, advice):
+    """Best-effort posix_fadvise; a no-op off Linux or on odd files."""
+    if hasattr(os, "posix_fadvise"):
+        try:
+            os.posix_fadvise(fd, 0, 0, advice)
+        except OSError:
+            pass
+
+# Digests are remembered per (path, mtime, size) so re-analyzing a folder
+# (e.g. after organizing) never re-reads unchanged files. The sqlite copy
+# makes the cache survive restarts.
+_HASH_DB_PATH = os.path.join(
+    os.path.expanduser("~"), ".cache", "diro", "hashes.sqlite"
+)
+_hash_db = None
+_hash_db_lock = threading.Lock()
+
+def _hash_db_conn():
+    global _hash_db
+    if _hash_db is None:
+        os.makedirs(os.path.dirname(_HASH_DB_PATH), exist_ok=True)
+        _hash_db = sqlite3.connect(_HASH_DB_PATH, check_same_thread=False)
+        _hash_db.execute(
+            "CREATE TABLE IF NOT EXISTS hashes ("
+            "path TEXT PRIMARY KEY, mtime_ns INTEGER, "
+            "size INTEGER, digest TEXT)"
+        )
+    return _hash_db
+
+@functools.lru_cache(maxsize=100_000)
+def _hash_cached(file_path, mtime_ns, size):
+    try:
+        with _hash_db_lock:
+            row = _hash_db_conn().execute(
+                "SELECT digest FROM hashes "
+                "WHERE path = ? AND mtime_ns = ? AND size = ?",
+                (file_path, mtime_ns, size)
+            ).fetchone()
+        if row:
+            return row[0]
+    except Exception as e:
+        logging.error(f"Error reading hash cache: {e}")
+    digest = _hash_uncached(file_path)
+    try:
+        with _hash_db_lock:
+            conn = _hash_db_conn()
+            conn.execute(
+                "INSERT OR REPLACE INTO hashes VALUES (?, ?, ?, ?)",
+                (file_path, mtime_ns, size, digest)
+            )
+            conn.commit()
+    except Exception as e:
+        logging.error(f"Error writing hash cache: {e}")
+    return digest
+
+def hash_file(file_path, mtime_ns=None, size=None):
+    # Callers holding stat data from the scan pass it in so the cache
+    # key costs nothing; bare calls stat once here.
+    if mtime_ns is None or size is None:
+        try:
+            st = os.stat(file_path)
+        except OSError:
+            return _hash_uncached(file_path)
+        mtime_ns, size = st.st_mtime_ns, st.st_size
+    return _hash_cached(file_path, mtime_ns, size)
+
+def _hash_many(jobs):
+    """
+    Hash several files concurrently and return {path: digest}. Each job
+    is (path, mtime_ns, size) -- stat fields may be None for paths the
+    caller never statted. Hashing is I/O- plus C-hash-bound, so threads
+    overlap reads; failed paths are logged and omitted.
+    """
+    jobs = list(jobs)
+    if not jobs:
+        return {}
+
+    def one(job):
+        path, mtime_ns, size = job
+        try:
+            return path, hash_file(path, mtime_ns, size)
+        except OSError as e:
+            logging.error(f"Error hashing {path}: {e}")
+            return path, None
+
+    workers = min(32, (os.cpu_count() or 1) * 4, len(jobs))
+    with ThreadPoolExecutor(max_workers=workers) as ex:
+        return {
+            path: digest
+            for path, digest in ex.map(one, jobs)
+            if digest is not None
+        }
 
 # ============================================================================
 # Sorting Functions 
 # ============================================================================
-def sort_by_type(files, recursive=False, base_path=None):
-    suggestions = {}
-    by_type = {}
-    for f in files:
-        by_type.setdefault(f["ext"], []).append(f["path"])
+def sort_by_type(files, recursive=False, base_path=None, by_type=None):
+    # Reuse the caller's extension buckets when it already built them
+    # (analyze_folder shares one dict between this and the report);
+    # otherwise bucket here in a single pass.
+    if by_type is None:
+        by_type = defaultdict(list)
+        for ext, path in zip(files.exts, files.paths):
+            by_type[ext].append(path)
+    tp = TYPE_PREFIX
+    nef = NO_EXTENSION_FOLDER
+    by_key = {
+        (f"{tp}{ext[1:]}" if ext != ".no_extension" else nef): paths
+        for ext, paths in by_type.items()
+    }
+
     if recursive and base_path:
-        for ext, paths in by_type.items():
+        suggestions = {}
+        singles = []
+        for key, paths in by_key.items():
             if len(paths) > 1:
-                key = (
-                   f"{TYPE_PREFIX}{ext[1:]}"
-                   if ext != ".no_extension"
-                   else NO_EXTENSION_FOLDER
-                )
                 suggestions[key] = paths
             else:
-                suggestions.setdefault(base_path, []).append(paths[0])
-    else:
-        for ext, paths in by_type.items():
-            key = (
-                f"{TYPE_PREFIX}{ext[1:]}" 
-                if ext != ".no_extension"
-                else NO_EXTENSION_FOLDER
-            )
-            suggestions[key] = paths
-    return suggestions
+                singles.extend(paths)
+        if singles:
+            suggestions[base_path] = singles
+        return Suggestion.from_groups(suggestions)
+    return Suggestion.from_groups(by_key)
 
 def sort_by_similarity(files, check_contents=False):
-    def similarity_score(key1, key2):
-        if check_contents:
-            s1, s2 = key1, key2
-            if s1 == s2:
-                return 100
-            common = sum(1 for c1, c2 in zip(s1, s2) if c1 == c2)
-            total = max(len(s1), len(s2))
-            return (common / total) * 100
-        else:
-            s1 = key1.rsplit('.', 1)[0].lower()
-            s2 = key2.rsplit('.', 1)[0].lower()
-            if abs(len(s1) - len(s2)) > max(len(s1), len(s2)) // 2:
-                return 0
-            common = sum(1 for c in set(s1) if c in s2)
-            total = max(len(s1), len(s2))
-            score = (common / total) * 100 if total > 0 else 0
-            prefix_len = 0
-            for c1, c2 in zip(s1, s2):
-                if c1 != c2:
-                    break
-                prefix_len += 1
-            if prefix_len >= 3:
-                score = min(100, score + prefix_len * 5)
-            return score
+    return Suggestion.from_groups(_similarity_groups(files, check_contents))
+
+def _similarity_groups(files, check_contents):
+    if not len(files):
+        return {}
+
+    if check_contents:
+        return _similar_content_groups(files)
+
+    if process is not None and np is not None:
+        return _similar_name_groups_rapidfuzz(files)
+    if _pairwise_scores is not None:
+        return _similar_name_groups_numba(files)
+    if np is not None:
+        return _similar_name_groups_numpy(files)
+
+    # Pure-Python fallback. A character-trigram inverted index prunes
+    # the O(n^2) pair space to names sharing at least one trigram --
+    # the same candidate-generation idea as MinHash/LSH, done with
+    # stdlib dicts since names scoring >= 60 virtually always share a
+    # trigram (a 3-char common prefix alone guarantees one).
+    paths = files.paths
+    stems = files.stems
+    stemsets = [frozenset(stem) for stem in stems]
+    lens = [len(stem) for stem in stems]
+    # 64-bit character-presence mask per stem: one AND + popcount
+    # rejects most dissimilar pairs before the full scorer runs.
+    bits = [
+        sum(1 << (ord(c) & 63) for c in stemset) for stemset in stemsets
+    ]
+    grams = [
+        {stem[k:k + 3] for k in range(len(stem) - 2)} or {stem}
+        for stem in stems
+    ]
+    by_gram = {}
+    for i, gram_set in enumerate(grams):
+        for gram in gram_set:
+            by_gram.setdefault(gram, []).append(i)
+
+    # Scoring reads the precomputed features by index, so the inner
+    # loop does no string splitting or set construction per pair.
+    def score_pair(i, j):
+        total = max(lens[i], lens[j])
+        if total == 0 or abs(lens[i] - lens[j]) > total // 2:
+            return 0
+        common = len(stemsets[i] & stemsets[j])
+        score = (common / total) * 100
+        prefix_len = 0
+        for c1, c2 in zip(stems[i], stems[j]):
+            if c1 != c2:
+                break
+            prefix_len += 1
+        if prefix_len >= 3:
+            score = min(100, score + prefix_len * 5)
+        return score
 
     suggestions = {}
     processed = set()
-    hashes = {}
     group_counter = 1
 
-    for i, f1 in enumerate(files):
-        if f1["path"] in processed:
+    for i, path1 in enumerate(paths):
+        if i in processed:
             continue
-        group = [f1["path"]]
-        key1 = hash_file(f1["path"]) if check_contents else f1["name"]
-        if check_contents:
-            hashes[f1["path"]] = key1
+        group = [path1]
 
-        for f2 in files[i+1:]:
-            if f2["path"] in processed:
+        candidates = sorted({
+            j for gram in grams[i] for j in by_gram[gram]
+            if j > i and j not in processed
+        })
+        bi = bits[i]
+        for j in candidates:
+            # Mask Jaccard below ~0.3 can't plausibly score >= 60;
+            # kept deliberately loose so the prefix bonus never has to
+            # rescue a pair the filter already dropped.
+            union = (bi | bits[j]).bit_count()
+            if union and (bi & bits[j]).bit_count() * 10 < union * 3:
                 continue
-            key2 = (hashes.get(f2["path"], hash_file(f2["path"]))
-                    if check_contents else f2["name"])
-            if check_contents and f2["path"] not in hashes:
-                hashes[f2["path"]] = key2
-            score = similarity_score(key1, key2)
-            if score >= 60:
-                group.append(f2["path"])
-                processed.add(f2["path"])
+            if score_pair(i, j) >= 60:
+                group.append(paths[j])
+                processed.add(j)
 
         if len(group) > 1:
             suggestions[f"{SIMILAR_PREFIX}{group_counter}"] = group
             group_counter += 1
-        processed.add(f1["path"])
+        processed.add(i)
 
     return suggestions
 
+def _similar_content_groups(files):
+    """
+    Group files whose contents are identical. Different sizes can never
+    match, so only files sharing a size get hashed; equal digests then
+    define the groups outright -- no pairwise scoring.
+    """
+    by_size = {}
+    for i, size in enumerate(files.sizes):
+        by_size.setdefault(size, []).append(i)
+
+    contenders = [
+        i for indices in by_size.values() if len(indices) > 1
+        for i in indices
+    ]
+    digests = _hash_many(
+        (files.paths[i], files.mtimes[i] or None, files.sizes[i])
+        for i in contenders if files.hashes[i] is None
+    )
+
+    by_hash = {}
+    for i in contenders:
+        digest = files.hashes[i] or digests.get(files.paths[i])
+        if digest is not None:
+            by_hash.setdefault(digest, []).append(files.paths[i])
+
+    suggestions = {}
+    group_counter = 1
+    for group in by_hash.values():
+        if len(group) > 1:
+            suggestions[f"{SIMILAR_PREFIX}{group_counter}"] = group
+            group_counter += 1
+    return suggestions
+
+def _groups_from_score_matrix(files, matrix):
+    """Build SimilarN groups from a pairwise score matrix via union-find."""
+    parent = list(range(len(files)))
+
+    def find(a):
+        while parent[a] != a:
+            parent[a] = parent[parent[a]]
+            a = parent[a]
+        return a
+
+    for i, j in zip(*np.nonzero(matrix >= 60)):
+        if i < j:
+            parent[find(j)] = find(i)
+
+    groups = {}
+    for i, path in enumerate(files.paths):
+        groups.setdefault(find(i), []).append(path)
+
+    suggestions = {}
+    group_counter = 1
+    for group in groups.values():
+        if len(group) > 1:
+            suggestions[f"{SIMILAR_PREFIX}{group_counter}"] = group
+            group_counter += 1
+    return suggestions
+
+def _similar_name_groups_rapidfuzz(files):
+    """Group files by name similarity using RapidFuzz's batched C scorer."""
+    stems = files.stems
+    matrix = process.cdist(
+        stems, stems, scorer=fuzz.ratio, score_cutoff=60, workers=-1
+    )
+    # fuzz.ratio("", "") is 100, which would lump every empty stem
+    # (dotfiles like .bashrc) into one group; the other tiers score
+    # empty stems 0, so do the same here.
+    empty = [i for i, stem in enumerate(stems) if not stem]
+    if empty:
+        matrix[empty, :] = 0
+        matrix[:, empty] = 0
+    return _groups_from_score_matrix(files, matrix)
+
+def _similar_name_groups_numpy(files):
+    """
+    NumPy tier (rapidfuzz and numba absent): a character-presence
+    matrix product computes every pair's overlap count in C, and pairs
+    are dropped unless their best case -- overlap score plus the
+    largest prefix bonus their lengths allow -- clears the cutoff.
+    Only survivors get the exact Python scorer.
+    """
+    stems = files.stems
+    n = len(stems)
+    lens = np.array([len(s) for s in stems], dtype=np.int32)
+    pres = np.zeros((n, 128), dtype=np.int32)
+    for i, stem in enumerate(stems):
+        for c in set(stem):
+            # & 127 folds non-ASCII into shared buckets: that can only
+            # overestimate the overlap, which keeps the bound safe.
+            pres[i, ord(c) & 127] = 1
+
+    common = pres @ pres.T
+    total = np.maximum(np.maximum.outer(lens, lens), 1)
+    bound = common / total * 100 + 5 * np.minimum.outer(lens, lens)
+    bound[np.abs(lens[:, None] - lens[None, :]) > total // 2] = 0
+
+    stemsets = [frozenset(stem) for stem in stems]
+    matrix = np.zeros((n, n), dtype=np.float32)
+    for i, j in zip(*np.nonzero(np.triu(bound >= 60, k=1))):
+        score = len(stemsets[i] & stemsets[j]) / max(lens[i], lens[j]) * 100
+        prefix_len = 0
+        for c1, c2 in zip(stems[i], stems[j]):
+            if c1 != c2:
+                break
+            prefix_len += 1
+        if prefix_len >= 3:
+            score = min(100, score + prefix_len * 5)
+        matrix[i, j] = score
+    return _groups_from_score_matrix(files, matrix)
+
+if njit is not None and np is not None:
+    @njit(cache=True)
+    def _popcount64(v):
+        """SWAR bit count for one uint64."""
+        v = v - ((v >> np.uint64(1)) & np.uint64(0x5555555555555555))
+        v = ((v & np.uint64(0x3333333333333333))
+             + ((v >> np.uint64(2)) & np.uint64(0x3333333333333333)))
+        v = (v + (v >> np.uint64(4))) & np.uint64(0x0F0F0F0F0F0F0F0F)
+        return (v * np.uint64(0x0101010101010101)) >> np.uint64(56)
+
+    @njit(cache=True, parallel=True)
+    def _pairwise_scores(names_u64, lengths, masks):
+        """
+        Nopython mirror of similarity_score's filename branch. Names
+        arrive packed eight bytes per uint64 and as 128-bit character
+        presence masks, so the common-character count is two AND +
+        popcount operations and the shared prefix advances eight
+        characters per XOR instead of one per iteration.
+        """
+        n = names_u64.shape[0]
+        words = names_u64.shape[1]
+        out = np.zeros((n, n), dtype=np.float32)
+        for i in prange(n):
+            l1 = lengths[i]
+            for j in range(i + 1, n):
+                l2 = lengths[j]
+                total = max(l1, l2)
+                if total == 0 or abs(l1 - l2) > total // 2:
+                    continue
+                common = np.int64(
+                    _popcount64(masks[i, 0] & masks[j, 0])
+                    + _popcount64(masks[i, 1] & masks[j, 1])
+                )
+                score = common / total * 100.0
+                prefix_len = np.int64(0)
+                for k in range(words):
+                    diff = names_u64[i, k] ^ names_u64[j, k]
+                    if diff != np.uint64(0):
+                        low_bit = diff & (np.uint64(0) - diff)
+                        trailing = np.int64(
+                            _popcount64(low_bit - np.uint64(1))
+                        )
+                        prefix_len += trailing >> 3
+                        break
+                    prefix_len += 8
+                max_prefix = min(l1, l2)
+                if prefix_len > max_prefix:
+                    prefix_len = max_prefix
+                if prefix_len >= 3:
+                    score = min(100.0, score + prefix_len * 5.0)
+                out[i, j] = score
+        return out
+
+    # Warm up the JIT with a dummy call so the first real analysis
+    # doesn't pay the compile cost.
+    try:
+        _pairwise_scores(np.zeros((2, 1), dtype=np.uint64),
+                         np.ones(2, dtype=np.int64),
+                         np.zeros((2, 2), dtype=np.uint64))
+    except Exception as e:
+        logging.error(f"Disabling numba scorer: {e}")
+        _pairwise_scores = None
+else:
+    _pairwise_scores = None
+
+def _similar_name_groups_numba(files):
+    """Group files by name similarity using the JIT-compiled scorer."""
+    stems = files.stems
+    encoded = [
+        np.frombuffer(s.encode('ascii', 'ignore'), dtype=np.uint8)
+        for s in stems
+    ]
+    lengths = np.array([a.size for a in encoded], dtype=np.int64)
+    # Pad to a multiple of 8 bytes so rows pack cleanly into uint64s.
+    width = max(8, int(lengths.max()) if len(lengths) else 0)
+    width += (-width) % 8
+    names_arr = np.zeros((len(encoded), width), dtype=np.uint8)
+    masks = np.zeros((len(encoded), 2), dtype=np.uint64)
+    for i, a in enumerate(encoded):
+        names_arr[i, :a.size] = a
+        lo = hi = 0
+        for c in set(a.tolist()):
+            if c < 64:
+                lo |= 1 << c
+            else:
+                hi |= 1 << (c - 64)
+        masks[i, 0] = lo
+        masks[i, 1] = hi
+    matrix = _pairwise_scores(names_arr.view(np.uint64), lengths, masks)
+    return _groups_from_score_matrix(files, matrix)
+
 def move_files_into_one_folder(files, check_contents=False):
-    if files:
-        return {ALL_FILES_FOLDER: [f["path"] for f in files]}
-    return {}
+    if len(files):
+        return Suggestion.from_groups({ALL_FILES_FOLDER: list(files.paths)})
+    return Suggestion.from_groups({})
 
 # ============================================================================
 # File Organization Functions 
@@ -270,6 +862,10 @@ def organize_files(
     root_path = (base_path or 
                  suggestions[next(iter(suggestions))][0].rsplit('/', 1)[0])
 
+    # Resolve every destination up front -- one scandir per destination
+    # folder seeds the collision checks, which then run entirely in
+    # memory -- and overlap the moves across a thread pool.
+    plan = []
     for folder_name, files in suggestions.items():
         new_folder = (
             folder_name
@@ -277,35 +873,47 @@ def organize_files(
             else os.path.join(root_path, folder_name)
         )
         os.makedirs(new_folder, exist_ok=True)
+        taken = _existing_names(new_folder)
         for file_path in files:
-            try:
-                safe_move_file(file_path, new_folder)
-            except Exception as e:
-                logging.error(f"Error moving {file_path}: {e}")
+            plan.append(
+                (file_path, _plan_dest(file_path, new_folder, taken))
+            )
+
+    if plan:
+        same_dev = _same_device(plan[0][0], root_path)
+        max_workers = min(32, (os.cpu_count() or 1) * 4)
+        with ThreadPoolExecutor(max_workers=max_workers) as ex:
+            list(ex.map(lambda sd: _move_planned(*sd, same_dev=same_dev),
+                        plan))
 
     if recursive and cleanup:
-        empty_folders_found = False
-        for root, dirs, _ in os.walk(root_path, topdown=False):
-            if root != root_path and not os.listdir(root):
-                empty_folders_found = True
-                break
-        if empty_folders_found:
+        # One bottom-up walk finds every empty folder; the walk already
+        # enumerated each directory, so no extra listdir/stat calls. A
+        # folder whose subfolders are all empty counts as empty too,
+        # since they are deleted (or moved out) before it is handled.
+        empties = []
+        empty_set = set()
+        for root, dirs, fnames in os.walk(root_path, topdown=False):
+            if (
+                root != root_path
+                and not fnames
+                and all(os.path.join(root, d) in empty_set for d in dirs)
+            ):
+                empties.append(root)
+                empty_set.add(root)
+
+        if empties:
             if delete_empty:
-                for root, dirs, _ in os.walk(root_path, topdown=False):
-                    if root != root_path and not os.listdir(root):
-                        try:
-                            safe_delete_folder(root)
-                        except Exception as e:
-                            logging.error(f"Error deleting folder {root}: {e}")
+                for root in empties:
+                    try:
+                        safe_delete_folder(root)
+                    except Exception as e:
+                        logging.error(f"Error deleting folder {root}: {e}")
             else:
                 empty_folders = os.path.join(root_path, EMPTY_FOLDERS_FOLDER)
                 os.makedirs(empty_folders, exist_ok=True)
-                for root, dirs, _ in os.walk(root_path, topdown=False):
-                    if (
-                        root != root_path
-                        and root != empty_folders
-                        and not os.listdir(root)
-                    ):
+                for root in empties:
+                    if root != empty_folders:
                         try:
                             safe_move_folder(root, empty_folders)
                         except Exception as e:
@@ -316,28 +924,44 @@ def move_duplicates(duplicates, base_path, check_contents=False):
         return
     dup_folder = os.path.join(base_path, DUPLICATES_FOLDER)
     os.makedirs(dup_folder, exist_ok=True)
+    same_dev = _same_device(duplicates[0], dup_folder)
+    # One readdir of the destination, then every name is resolved in
+    # memory -- no per-file exists() probing no matter how many prior
+    # duplicates already sit in the folder.
+    taken = _existing_names(dup_folder)
 
     if check_contents:
-        by_hash = {}
+        # Group by size before touching content: a size seen only once
+        # in the batch cannot share bytes with another entry, so its
+        # digest is never needed and the size itself makes a stable
+        # prefix. Files that do share a size get the digest prefix,
+        # which groups copies of the same content under one name (and
+        # usually hits the (path, mtime, size) hash cache anyway).
+        by_size = {}
         for path in duplicates:
-            if os.path.getsize(path) > 0:
-                hash_val = hash_file(path)
-                by_hash.setdefault(hash_val, []).append(path)
-        final_dups = [path for paths in by_hash.values() if len(paths) > 1 for path in paths]
+            try:
+                size = os.stat(path).st_size
+            except OSError as e:
+                logging.error(f"Error reading duplicate {path}: {e}")
+                continue
+            by_size.setdefault(size, []).append(path)
+        for size, paths in by_size.items():
+            for path in paths:
+                if len(paths) > 1:
+                    try:
+                        prefix = f"{DUPLICATE_PREFIX}{hash_file(path)[:8]}_"
+                    except OSError as e:
+                        logging.error(f"Error hashing duplicate {path}: {e}")
+                        continue
+                else:
+                    prefix = f"{DUPLICATE_PREFIX}{size:x}_"
+                dest = _plan_dest(path, dup_folder, taken, prefix=prefix)
+                _move_planned(path, dest, same_dev=same_dev)
     else:
-        final_dups = duplicates
-
-    for i, path in enumerate(final_dups):
-        base_name = os.path.basename(path)
-        dest_path = os.path.join(dup_folder, f"{DUPLICATE_PREFIX}{i}_{base_name}")
-        counter = i
-        while os.path.exists(dest_path):
-            counter += 1
-            dest_path = os.path.join(dup_folder, f"{DUPLICATE_PREFIX}{counter}_{base_name}")
-        try:
-            safe_move_file(path, dup_folder, prefix=f"{DUPLICATE_PREFIX}_")
-        except Exception as e:
-            logging.error(f"Error moving duplicate {path}: {e}")
+        for i, path in enumerate(duplicates):
+            dest = _plan_dest(path, dup_folder, taken,
+                              prefix=f"{DUPLICATE_PREFIX}{i}_")
+            _move_planned(path, dest, same_dev=same_dev)
 
 # ============================================================================
 # Helper Functions
@@ -345,56 +969,94 @@ def move_duplicates(duplicates, base_path, check_contents=False):
 def analyze_folder(folder, recursive=False, check_contents=False):
     """Analyze the folder and generate organization suggestions."""
     files, duplicates = get_file_info(folder, recursive=recursive)
+    by_type = defaultdict(list)
+    for ext, path in zip(files.exts, files.paths):
+        by_type[ext].append(path)
     suggestions = {
-        "Type": sort_by_type(files, recursive=recursive, base_path=folder),
+        "Type": sort_by_type(files, recursive=recursive, base_path=folder,
+                             by_type=by_type),
         "Similarity": sort_by_similarity(files, check_contents=check_contents),
         "Move Files into One Folder": move_files_into_one_folder(files)
     }
-    return files, duplicates, suggestions
+    return files, duplicates, suggestions, by_type
 
-def update_results(files, duplicates, suggestions, results_text, buttons, dup_btn, subfolders_checkbox, folder):
+def update_results(files, duplicates, suggestions, by_type, results_text, buttons, dup_btn, subfolders_checkbox, folder):
     """Update the UI with analysis results and suggestions."""
     scope = "Recursive" if subfolders_checkbox.isChecked() else "Top-Level Only"
-    text = f"Analysis Results of {len(files) + len(duplicates)} Total Files ({scope}):\n"
-    text += f"Unique Files: {len(files)}, Duplicates Found: {len(duplicates)}\n\nYou Currently Have:\n"
-    by_type = {}
-    for f in files:
-        by_type.setdefault(f["ext"], []).append(f["path"])
+    # Build the report as a list of parts: repeated str += is O(n^2).
+    out = []
+    out.append(f"Analysis Results of {len(files) + len(duplicates)} Total Files ({scope}):\n")
+    out.append(f"Unique Files: {len(files)}, Duplicates Found: {len(duplicates)}\n\nYou Currently Have:\n")
     for ext, paths in sorted(by_type.items()):
-        text += f"{len(paths)} {ext} file(s)\n"
+        out.append(f"{len(paths)} {ext} file(s)\n")
 
     if duplicates:
-        text += "\nDuplicates (Not Yet Sorted):\n"
+        out.append("\nDuplicates (Not Yet Sorted):\n")
         for dup_path in duplicates:
-            text += f"{dup_path}\n"
+            out.append(f"{dup_path}\n")
 
-    text += "\nOrganization Options:\n"
+    # Sample names come from the table we already parsed during the
+    # scan, so no basename splitting while rendering.
+    name_by_path = dict(zip(files.paths, files.names))
+    out.append("\nOrganization Options:\n")
     for name, suggestion in suggestions.items():
         if not suggestion:
             continue
-        num_groups = len([k for k in suggestion if k != folder])
-        largest_group = max(len(paths) for paths in suggestion.values()) if suggestion else 0
-        text += f"By {name} ({num_groups} groups, largest: {largest_group}):\n"
-        for folder_name, paths in suggestion.items():
-            samples = [os.path.basename(p) for p in paths[:2]]
-            if folder_name == folder:
-                text += f"  Main Directory: {len(paths)} files (e.g., {', '.join(samples)})\n"
-            else:
-                text += f"  {folder_name}: {len(paths)} files (e.g., {', '.join(samples)})\n"
+        num_groups = len([k for k in suggestion.groups if k != folder])
+        out.append(f"By {name} ({num_groups} groups, largest: {suggestion.largest}):\n")
+        out.append("".join(
+            f"  {'Main Directory' if folder_name == folder else folder_name}: "
+            f"{len(paths)} files "
+            f"(e.g., {', '.join(name_by_path.get(p) or os.path.basename(p) for p in paths[:2])})\n"
+            for folder_name, paths in suggestion.groups.items()
+        ))
 
-    text += "\nRecommendation: "
+    out.append("\nRecommendation: ")
     if len(suggestions["Type"]) > 2:
-        text += "'Type' - Best for organizing varied file types."
-    elif len(suggestions["Similarity"]) > 1 and len(files) - sum(len(v) for v in suggestions["Similarity"].values()) < len(files) // 2:
-        text += "'Similarity' - Good for grouping similar filenames."
+        out.append("'Type' - Best for organizing varied file types.")
+    elif len(suggestions["Similarity"]) > 1 and len(files) - suggestions["Similarity"].total < len(files) // 2:
+        out.append("'Similarity' - Good for grouping similar filenames.")
     else:
-        text += "'Move Files into One Folder' - Simplest consolidation into one folder."
+        out.append("'Move Files into One Folder' - Simplest consolidation into one folder.")
 
-    results_text.setText(text)
+    # Suspend repaints while the document is replaced: one redraw for
+    # the whole report instead of a repaint storm on large listings.
+    results_text.setUpdatesEnabled(False)
+    try:
+        results_text.setPlainText("".join(out))
+    finally:
+        results_text.setUpdatesEnabled(True)
     for btn in buttons.values():
         btn.setEnabled(True)
     dup_btn.setEnabled(bool(duplicates))
 
+class AnalyzeSignals(QObject):
+    finished = Signal(object, object, object, object)
+    failed = Signal(str)
+
+class AnalyzeWorker(QRunnable):
+    """Run analyze_folder off the UI thread so the window stays responsive."""
+
+    def __init__(self, folder, recursive, check_contents):
+        super().__init__()
+        self.folder = folder
+        self.recursive = recursive
+        self.check_contents = check_contents
+        self.signals = AnalyzeSignals()
+
+    def run(self):
+        try:
+            files, duplicates, suggestions, by_type = analyze_folder(
+                self.folder,
+                recursive=self.recursive,
+                check_contents=self.check_contents
+            )
+        except Exception as e:
+            logging.error(f"Error analyzing {self.folder}: {e}")
+            self.signals.failed.emit(str(e))
+            return
+        self.signals.finished.emit(files, duplicates, suggestions, by_type)
+
 # ============================================================================
 # Main Application
 # ============================================================================
@@ -417,6 +1079,9 @@ def main():
     results_text = QTextEdit()
     results_text.setReadOnly(True)
     status_label = QLabel("")
+    progress_bar = QProgressBar()
+    progress_bar.setRange(0, 0)  # Indeterminate "busy" indicator
+    progress_bar.hide()
 
     # Add UI Elements in Order
     layout.addWidget(select_btn)
@@ -426,6 +1091,7 @@ def main():
     layout.addWidget(content_checkbox)
     layout.addWidget(results_text)
     layout.addWidget(status_label)
+    layout.addWidget(progress_bar)
 
     # Organize Buttons
     sort_methods = {
@@ -455,36 +1121,67 @@ def main():
     current_files = [None]
     current_duplicates = [None]
     current_suggestions = [None]
+    analyzing = [False]
 
     # Event Handlers
     def on_select():
+        if analyzing[0]:
+            return
         folder = select_folder(window)
         if folder:
             current_folder[0] = folder
-            status_label.setText(f"selected: {folder} (click OK to confirm)")
-            files, duplicates, suggestions = analyze_folder(
-                folder,
-                recursive=subfolders_checkbox.isChecked(),
-                check_contents=content_checkbox.isChecked()
-            )
-            current_files[0] = files
-            current_duplicates[0] = duplicates
-            current_suggestions[0] = suggestions
-            update_results(
-                files, duplicates, suggestions, results_text, buttons, dup_btn,
-                subfolders_checkbox, folder
-            )
-            status_label.setText(f"Selected: {folder}")
+            start_analysis()
+
+    def start_analysis():
+        # Single-flight: one analysis at a time, so stray clicks can't
+        # stack workers racing to overwrite each other's results.
+        if analyzing[0]:
+            return
+        analyzing[0] = True
+        folder = current_folder[0]
+        status_label.setText(f"Analyzing: {folder} ...")
+        select_btn.setEnabled(False)
+        for btn in buttons.values():
+            btn.setEnabled(False)
+        dup_btn.setEnabled(False)
+        progress_bar.show()
+        worker = AnalyzeWorker(
+            folder,
+            subfolders_checkbox.isChecked(),
+            content_checkbox.isChecked()
+        )
+        worker.signals.finished.connect(on_analysis_done)
+        worker.signals.failed.connect(on_analysis_failed)
+        QThreadPool.globalInstance().start(worker)
+
+    def on_analysis_done(files, duplicates, suggestions, by_type):
+        analyzing[0] = False
+        progress_bar.hide()
+        select_btn.setEnabled(True)
+        current_files[0] = files
+        current_duplicates[0] = duplicates
+        current_suggestions[0] = suggestions
+        update_results(
+            files, duplicates, suggestions, by_type, results_text,
+            buttons, dup_btn, subfolders_checkbox, current_folder[0]
+        )
+        status_label.setText(f"Selected: {current_folder[0]}")
+
+    def on_analysis_failed(message):
+        analyzing[0] = False
+        progress_bar.hide()
+        select_btn.setEnabled(True)
+        status_label.setText(f"Analysis failed: {message}")
 
     def reset_and_reanalyze():
         if current_folder[0]:
-            on_select()
+            start_analysis()
 
     def make_organize(name):
         def on_organize():
             if current_suggestions[0]:
                 suggestions = current_suggestions[0]
-                organize_files(suggestions[name], recursive=subfolders_checkbox.isChecked(),
+                organize_files(suggestions[name].groups, recursive=subfolders_checkbox.isChecked(),
                              cleanup=cleanup_checkbox.isChecked(), delete_empty=delete_empty_checkbox.isChecked(),
                              base_path=current_folder[0])
                 status_label.setText(f"Files organized by {name.lower()} successfully!")
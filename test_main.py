@@ -1,11 +1,14 @@
 import unittest
 import os
+import tempfile
 from unittest.mock import patch, MagicMock, mock_open
 from unittest import mock
 import shutil
 import hashlib
-from PySide6.QtWidgets import QFileDialog 
+from PySide6.QtWidgets import QFileDialog
+import main
 from main import (
+    FileTable,
     select_folder, get_file_info, hash_file,
     sort_by_type, sort_by_similarity, move_files_into_one_folder,
     organize_files, move_duplicates,
@@ -43,149 +46,235 @@ class TestDirectoryOrganizer(unittest.TestCase):
         # Assert
         self.assertIsNone(result)
 
-    @patch('os.scandir')
-    def test_get_file_info_single_file(self, mock_scandir):
-        # Setup mock
-        mock_entry = MagicMock()
-        mock_entry.is_file.return_value = True
-        mock_entry.is_dir.return_value = False
-        mock_entry.path = '/test/file.txt'
-        mock_entry.name = 'file.txt'
-        mock_scandir.return_value.__enter__.return_value = [mock_entry]
-
-        # Call function
-        files, duplicates = get_file_info('/test')
-
-        # Assert
-        expected_files = [{
-            'path': '/test/file.txt',
-            'name': 'file.txt',
-            'ext': '.txt',
-            'words': ['file']
-        }]
-        self.assertEqual(files, expected_files)
-        self.assertEqual(duplicates, [])
-
-    @patch('os.scandir')
-    def test_get_file_info_duplicate_files(self, mock_scandir):
-        # Setup mock
-        mock_entry1 = MagicMock()
-        mock_entry1.is_file.return_value = True
-        mock_entry1.is_dir.return_value = False
-        mock_entry1.path = '/test/file.txt'
-        mock_entry1.name = 'file.txt'
-
-        mock_entry2 = MagicMock()
-        mock_entry2.is_file.return_value = True
-        mock_entry2.is_dir.return_value = False
-        mock_entry2.path = '/test/sub/file.txt'
-        mock_entry2.name = 'file.txt'
-
-        mock_scandir.return_value.__enter__.return_value = [mock_entry1, mock_entry2]
-
-        # Call function
-        files, duplicates = get_file_info('/test', recursive=True)
-
-        # Assert
-        expected_files = [{
-            'path': '/test/file.txt',
-            'name': 'file.txt',
-            'ext': '.txt',
-            'words': ['file']
-        }]
-        self.assertEqual(files, expected_files)
-        self.assertEqual(duplicates, ['/test/sub/file.txt'])
-
-    @patch('builtins.open', new_callable=mock_open, read_data=b"test content")
-    def test_hash_file(self, mock_file):
-        # Call function
-        result = hash_file('/test/file.txt')
-
-        # Assert
-        expected_hash = hashlib.md5(b"test content").hexdigest()
-        self.assertEqual(result, expected_hash)
-        mock_file.assert_called_with('/test/file.txt', 'rb')
+    def test_get_file_info_single_file(self):
+        with tempfile.TemporaryDirectory() as folder:
+            file_path = os.path.join(folder, 'file.txt')
+            with open(file_path, 'w') as f:
+                f.write('content')
+
+            files, duplicates = get_file_info(folder)
+
+            expected_files = FileTable(
+                paths=[file_path],
+                names=['file.txt'],
+                exts=['.txt'],
+                sizes=[7],
+                mtimes=[os.stat(file_path).st_mtime_ns]
+            )
+            self.assertEqual(files, expected_files)
+            self.assertEqual(duplicates, [])
+
+    def test_get_file_info_duplicate_files(self):
+        with tempfile.TemporaryDirectory() as folder:
+            top_path = os.path.join(folder, 'file.txt')
+            sub_path = os.path.join(folder, 'sub', 'file.txt')
+            os.makedirs(os.path.dirname(sub_path))
+            for path in (top_path, sub_path):
+                with open(path, 'w') as f:
+                    f.write('content')
+
+            files, duplicates = get_file_info(folder, recursive=True)
+
+            expected_files = FileTable(
+                paths=[top_path],
+                names=['file.txt'],
+                exts=['.txt'],
+                sizes=[7],
+                mtimes=[os.stat(top_path).st_mtime_ns],
+                hashes=[hash_file(top_path)]
+            )
+            self.assertEqual(files, expected_files)
+            self.assertEqual(duplicates, [sub_path])
+
+    def test_get_file_info_renamed_duplicate(self):
+        # Same contents under different names is still a duplicate.
+        with tempfile.TemporaryDirectory() as folder:
+            original = os.path.join(folder, 'a.txt')
+            renamed = os.path.join(folder, 'b.txt')
+            for path in (original, renamed):
+                with open(path, 'w') as f:
+                    f.write('same bytes')
+            other = os.path.join(folder, 'other.txt')
+            with open(other, 'w') as f:
+                f.write('different')
+
+            files, duplicates = get_file_info(folder)
+
+            # Either copy may be kept, depending on scan order.
+            self.assertEqual(len(duplicates), 1)
+            self.assertIn(duplicates[0], (original, renamed))
+            expected_kept = (
+                {original, renamed, other} - {duplicates[0]}
+            )
+            self.assertEqual(set(files.paths), expected_kept)
+
+    def test_hash_file(self):
+        with tempfile.NamedTemporaryFile(delete=False) as tmp:
+            tmp.write(b"test content")
+            path = tmp.name
+        try:
+            result = hash_file(path)
+            if main.blake3 is not None:
+                expected_hash = main.blake3(b"test content").hexdigest()
+            elif main.xxhash is not None:
+                expected_hash = main.xxhash.xxh3_128(b"test content").hexdigest()
+            else:
+                expected_hash = hashlib.sha256(b"test content").hexdigest()
+            self.assertEqual(result, expected_hash)
+        finally:
+            os.unlink(path)
 
     # === Sorting Functions ===
 
     def test_sort_by_type_no_recursive(self):
-        files = [
-            {'path': '/test/file1.txt', 'name': 'file1.txt', 'ext': '.txt', 'words': ['file1']},
-            {'path': '/test/file2.pdf', 'name': 'file2.pdf', 'ext': '.pdf', 'words': ['file2']},
-            {'path': '/test/file3.txt', 'name': 'file3.txt', 'ext': '.txt', 'words': ['file3']}
-        ]
+        files = FileTable(
+            paths=['/test/file1.txt', '/test/file2.pdf', '/test/file3.txt'],
+            names=['file1.txt', 'file2.pdf', 'file3.txt'],
+            exts=['.txt', '.pdf', '.txt']
+        )
         suggestions = sort_by_type(files)
 
         expected = {
             'Type txt': ['/test/file1.txt', '/test/file3.txt'],
             'Type pdf': ['/test/file2.pdf']
         }
-        self.assertEqual(suggestions, expected)
+        self.assertEqual(suggestions.groups, expected)
+        self.assertEqual(suggestions.total, 3)
+        self.assertEqual(suggestions.largest, 2)
 
     def test_sort_by_type_recursive(self):
-        files = [
-            {'path': '/test/file1.txt', 'name': 'file1.txt', 'ext': '.txt', 'words': ['file1']},
-            {'path': '/test/file2.txt', 'name': 'file2.txt', 'ext': '.txt', 'words': ['file2']}
-        ]
+        files = FileTable(
+            paths=['/test/file1.txt', '/test/file2.txt'],
+            names=['file1.txt', 'file2.txt'],
+            exts=['.txt', '.txt']
+        )
         suggestions = sort_by_type(files, recursive=True, base_path='/test')
 
         expected = {
             'Type txt': ['/test/file1.txt', '/test/file2.txt']
         }
-        self.assertEqual(suggestions, expected)
+        self.assertEqual(suggestions.groups, expected)
 
     def test_sort_by_type_no_extension(self):
-        files = [
-            {'path': '/test/file1', 'name': 'file1', 'ext': '.no_extension', 'words': ['file1']}
-        ]
+        files = FileTable(
+            paths=['/test/file1'],
+            names=['file1'],
+            exts=['.no_extension']
+        )
         suggestions = sort_by_type(files)
 
         expected = {
             'No Extension': ['/test/file1']
         }
-        self.assertEqual(suggestions, expected)
+        self.assertEqual(suggestions.groups, expected)
 
     @patch('main.hash_file')
     def test_sort_by_similarity_contents(self, mock_hash):
-        files = [
-            {'path': '/test/file1.txt', 'name': 'file1.txt', 'ext': '.txt', 'words': ['file1']},
-            {'path': '/test/file2.txt', 'name': 'file2.txt', 'ext': '.txt', 'words': ['file2']}
-        ]
+        files = FileTable(
+            paths=['/test/file1.txt', '/test/file2.txt'],
+            names=['file1.txt', 'file2.txt'],
+            exts=['.txt', '.txt']
+        )
         mock_hash.side_effect = ['hash1', 'hash1']
         suggestions = sort_by_similarity(files, check_contents=True)
 
         expected = {
             'Similar1': ['/test/file1.txt', '/test/file2.txt']
         }
-        self.assertEqual(suggestions, expected)
+        self.assertEqual(suggestions.groups, expected)
 
     def test_sort_by_similarity_names(self):
-        files = [
-            {'path': '/test/doc1.txt', 'name': 'doc1.txt', 'ext': '.txt', 'words': ['doc1']},
-            {'path': '/test/doc2.txt', 'name': 'doc2.txt', 'ext': '.txt', 'words': ['doc2']}
-        ]
+        files = FileTable(
+            paths=['/test/doc1.txt', '/test/doc2.txt'],
+            names=['doc1.txt', 'doc2.txt'],
+            exts=['.txt', '.txt']
+        )
         suggestions = sort_by_similarity(files, check_contents=False)
 
         expected = {
             'Similar1': ['/test/doc1.txt', '/test/doc2.txt']
         }
-        self.assertEqual(suggestions, expected)
+        self.assertEqual(suggestions.groups, expected)
+
+    # Force each name-similarity tier in turn (the default test above
+    # only exercises whichever tier the installed extras select).
+
+    def test_sort_by_similarity_names_numba_tier(self):
+        if main._pairwise_scores is None:
+            self.skipTest("numba not installed")
+        files = FileTable(
+            paths=['/test/doc1.txt', '/test/doc2.txt', '/test/zzz_unrelated.bin'],
+            names=['doc1.txt', 'doc2.txt', 'zzz_unrelated.bin'],
+            exts=['.txt', '.txt', '.bin']
+        )
+        with patch('main.process', None):
+            suggestions = sort_by_similarity(files, check_contents=False)
+
+        expected = {
+            'Similar1': ['/test/doc1.txt', '/test/doc2.txt']
+        }
+        self.assertEqual(suggestions.groups, expected)
+
+    def test_sort_by_similarity_names_numpy_tier(self):
+        if main.np is None:
+            self.skipTest("numpy not installed")
+        files = FileTable(
+            paths=['/test/doc1.txt', '/test/doc2.txt', '/test/zzz_unrelated.bin'],
+            names=['doc1.txt', 'doc2.txt', 'zzz_unrelated.bin'],
+            exts=['.txt', '.txt', '.bin']
+        )
+        with patch('main.process', None), \
+             patch('main._pairwise_scores', None):
+            suggestions = sort_by_similarity(files, check_contents=False)
+
+        expected = {
+            'Similar1': ['/test/doc1.txt', '/test/doc2.txt']
+        }
+        self.assertEqual(suggestions.groups, expected)
+
+    def test_sort_by_similarity_names_python_fallback(self):
+        files = FileTable(
+            paths=['/test/doc1.txt', '/test/doc2.txt', '/test/zzz_unrelated.bin'],
+            names=['doc1.txt', 'doc2.txt', 'zzz_unrelated.bin'],
+            exts=['.txt', '.txt', '.bin']
+        )
+        with patch('main.process', None), \
+             patch('main._pairwise_scores', None), \
+             patch('main.np', None):
+            suggestions = sort_by_similarity(files, check_contents=False)
+
+        expected = {
+            'Similar1': ['/test/doc1.txt', '/test/doc2.txt']
+        }
+        self.assertEqual(suggestions.groups, expected)
+
+    def test_sort_by_similarity_empty_stems(self):
+        # Dotfiles have empty stems and must not be grouped together.
+        files = FileTable(
+            paths=['/test/.bashrc', '/test/.gitconfig', '/test/.txt'],
+            names=['.bashrc', '.gitconfig', '.txt'],
+            exts=['.bashrc', '.gitconfig', '.txt']
+        )
+        suggestions = sort_by_similarity(files, check_contents=False)
+
+        self.assertEqual(suggestions.groups, {})
 
     def test_move_files_into_one_folder(self):
-        files = [
-            {'path': '/test/file1.txt', 'name': 'file1.txt', 'ext': '.txt', 'words': ['file1']},
-            {'path': '/test/file2.pdf', 'name': 'file2.pdf', 'ext': '.pdf', 'words': ['file2']}
-        ]
+        files = FileTable(
+            paths=['/test/file1.txt', '/test/file2.pdf'],
+            names=['file1.txt', 'file2.pdf'],
+            exts=['.txt', '.pdf']
+        )
         suggestions = move_files_into_one_folder(files)
 
         expected = {
             'One Folder': ['/test/file1.txt', '/test/file2.pdf']
         }
-        self.assertEqual(suggestions, expected)
+        self.assertEqual(suggestions.groups, expected)
 
     def test_move_files_into_one_folder_empty(self):
-        suggestions = move_files_into_one_folder([])
-        self.assertEqual(suggestions, {})
+        suggestions = move_files_into_one_folder(FileTable())
+        self.assertEqual(suggestions.groups, {})
 
     # === File Organization Functions ===
 
@@ -231,37 +320,49 @@ class TestDirectoryOrganizer(unittest.TestCase):
         mock_move.assert_any_call('/test/file1.txt', '/test/Type txt/file1.txt')
         mock_move.assert_any_call('/test/empty', '/test/Empty Folders/empty')
 
+    def test_organize_files_delete_nested_empty(self):
+        # A folder containing only empty folders is itself empty.
+        with tempfile.TemporaryDirectory() as folder:
+            os.makedirs(os.path.join(folder, 'outer', 'inner'))
+            file_path = os.path.join(folder, 'file.txt')
+            with open(file_path, 'w') as f:
+                f.write('content')
+
+            organize_files(
+                {'Type txt': [file_path]}, recursive=True, cleanup=True,
+                delete_empty=True, base_path=folder
+            )
+
+            self.assertFalse(os.path.exists(os.path.join(folder, 'outer')))
+            self.assertTrue(
+                os.path.exists(os.path.join(folder, 'Type txt', 'file.txt'))
+            )
+
     @patch('os.makedirs')
     @patch('shutil.move')
-    @patch('os.path.exists')
-    def test_move_duplicates_names(self, mock_exists, mock_move, mock_makedirs):
-        existing_paths = set()
-        def exists_side_effect(path):
-            return path in existing_paths
-        mock_exists.side_effect = exists_side_effect
-        existing_paths.add('/test/Duplicates/Dupe0_file.txt')
+    @patch('main._existing_names')
+    def test_move_duplicates_names(self, mock_names, mock_move, mock_makedirs):
+        mock_names.return_value = {'Dupe0_file.txt'}
         duplicates = ['/source/file.txt']
         move_duplicates(duplicates, '/test/', check_contents=False)
-        print(mock_move.call_args_list)
         mock_makedirs.assert_called_with('/test/Duplicates', exist_ok=True)
-        mock_move.assert_any_call('/source/file.txt', '/test/Duplicates/Dupe0_file1.txt')
+        mock_move.assert_any_call('/source/file.txt', '/test/Duplicates/Dupe0_file_1.txt')
 
     # === Edge Cases ===
 
-    @patch('os.scandir')
-    def test_get_file_info_empty_folder(self, mock_scandir):
-        mock_scandir.return_value.__enter__.return_value = []
-        files, duplicates = get_file_info('/test')
-        self.assertEqual(files, [])
-        self.assertEqual(duplicates, [])
+    def test_get_file_info_empty_folder(self):
+        with tempfile.TemporaryDirectory() as folder:
+            files, duplicates = get_file_info(folder)
+            self.assertEqual(files, FileTable())
+            self.assertEqual(duplicates, [])
 
     def test_sort_by_type_empty(self):
-        suggestions = sort_by_type([])
-        self.assertEqual(suggestions, {})
+        suggestions = sort_by_type(FileTable())
+        self.assertEqual(suggestions.groups, {})
 
     def test_sort_by_similarity_empty(self):
-        suggestions = sort_by_similarity([])
-        self.assertEqual(suggestions, {})
+        suggestions = sort_by_similarity(FileTable())
+        self.assertEqual(suggestions.groups, {})
 
     @patch('os.makedirs')
     def test_organize_files_empty_suggestions(self, mock_makedirs):